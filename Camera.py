@@ -1,11 +1,13 @@
-import pygame
-
 class Camera:
     """
     Handles camera movement to follow the player with smooth scrolling.
     Includes boundaries to prevent showing areas outside the world.
     """
     
+    __slots__ = (
+        'player', 'screen_width', 'screen_height', 'ox', 'oy', 'ofx', 'ofy', 'cx', 'cy', 
+        'min_x', 'max_x', 'min_y', 'max_y')
+    
     def __init__(self, player, screen_width, screen_height):
         """
         Args:
@@ -16,33 +18,53 @@ class Camera:
         self.screen_width = screen_width
         self.screen_height = screen_height
         
-        # Camera position with float precision for smooth movement
-        self.offset = pygame.math.Vector2(0, 0)
-        self.offset_float = pygame.math.Vector2(0, 0)
+        # Camera position, as pixel offset and with float precision for smooth movement
+        self.ox, self.oy = 0, 0
+        self.ofx, self.ofy = 0.0, 0.0
         
         # Camera follows player with this offset from screen center
-        self.CONST = pygame.math.Vector2(
-            -self.screen_width / 2 + player.rect.x / 4, 
-            -player.rect.y)
+        self.cx = -self.screen_width / 2 + player.rect.x / 4
+        self.cy = -player.rect.y
+        
+        # Allowed offset range, unbounded until set_bounds() is called
+        self.min_x = self.min_y = float('-inf')
+        self.max_x = self.max_y = float('inf')
     
-    def scroll(self, left_border, right_border, top_border, bottom_border):
+    def set_bounds(self, left_border, right_border, top_border, bottom_border):
+        """
+        Set the world boundaries the camera must stay within.
+        
+        Args:
+            left_border, right_border, top_border, bottom_border: World edges in pixels
+        """
+        self.min_x = left_border
+        self.max_x = right_border - self.screen_width
+        self.min_y = top_border
+        self.max_y = bottom_border - self.screen_height
+        
+        # Checked in debug runs only; scroll() itself does no validation
+        assert self.min_x <= self.max_x and self.min_y <= self.max_y, \
+            "World is smaller than the viewport"
+    
+    def scroll(self):
         """
         Update camera position while respecting world boundaries.
         Added smoothing to reduce jitter during jumps.
+        
+        Returns:
+            bool: Whether the pixel offset changed
         """
-        # Smoother camera follow with lerping
-        target_x = self.player.rect.x + self.CONST.x
-        target_y = self.player.rect.y + self.CONST.y
-        
-        # Use linear interpolation for smoother movement
-        self.offset_float.x += (target_x - self.offset_float.x) * 0.1
-        self.offset_float.y += (target_y - self.offset_float.y) * 0.1
-        
-        # Convert to integer for pixel-perfect rendering
-        self.offset.x, self.offset.y = int(self.offset_float.x), int(self.offset_float.y)
-        
-        # Clamp camera position to world boundaries
-        self.offset.x = max(left_border, self.offset.x)
-        self.offset.x = min(self.offset.x, right_border - self.screen_width)
-        self.offset.y = max(top_border, self.offset.y)
-        self.offset.y = min(self.offset.y, bottom_border - self.screen_height)
\ No newline at end of file
+        # Smoother camera follow: lerp 10% of the way to the target each frame
+        player_rect = self.player.rect
+        ofx = self.ofx + (player_rect.x + self.cx - self.ofx) * 0.1
+        ofy = self.ofy + (player_rect.y + self.cy - self.ofy) * 0.1
+        self.ofx, self.ofy = ofx, ofy
+        
+        # Convert to integer for pixel-perfect rendering, clamped to world boundaries
+        ox, oy = int(ofx), int(ofy)
+        ox = self.min_x if ox < self.min_x else (self.max_x if ox > self.max_x else ox)
+        oy = self.min_y if oy < self.min_y else (self.max_y if oy > self.max_y else oy)
+        
+        moved = ox != self.ox or oy != self.oy
+        self.ox, self.oy = ox, oy
+        return moved
\ No newline at end of file
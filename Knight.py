@@ -1,17 +1,93 @@
 import pygame
-from debug import debug
+import image_cache
+from pygame import K_a, K_d, K_SPACE, K_LSHIFT
+from numba import njit, types
+from debug import debug, DEBUG_HUD
+from knight_physics import apply_gravity, resolve_collisions, clamp_position
+
+SCALED = (49, 66)     # On-screen sprite size: the 14x19 frames at 3.5x, rounded down
+
+@njit(
+    types.Tuple((types.float64, types.float64, types.boolean, types.float64, types.float64))(
+        types.float64, types.boolean, types.boolean, types.boolean, types.boolean, 
+        types.boolean, types.boolean, types.float64, types.boolean, 
+        types.float64, types.float64, types.float64, types.float64), 
+    cache=True)
+def step_horizontal(vel_x, left, right, sprinting, was_sprinting, jumped, sprint_jumped, 
+                    decel_ratio, decel_active, increment, max_vel_x, sprint_inc_mod, sprint_max_mod):
+    """
+    Compute the knight's new horizontal velocity for one frame.
+    
+    Args:
+        vel_x: Current horizontal velocity
+        left, right: Movement keys held
+        sprinting, was_sprinting: Sprint key held this frame / last frame
+        jumped: Whether the knight is airborne
+        sprint_jumped: Whether the knight was sprinting when it jumped
+        decel_ratio, decel_active: Post-sprint deceleration state
+        increment, max_vel_x: Base acceleration and top speed
+        sprint_inc_mod, sprint_max_mod: Sprint multipliers
+    
+    Returns:
+        tuple: (vel_x, decel_ratio, decel_active, max_vel_x, increment)
+    """
+    # Only apply deceleration if grounded
+    if not jumped:
+        # If we just stopped sprinting while grounded, store speed ratio
+        if was_sprinting and not sprinting:
+            decel_ratio = abs(vel_x) / (max_vel_x * sprint_max_mod)
+            decel_active = True
+        
+        # Adjust movement parameters if sprinting
+        if sprinting:
+            max_vel_x *= sprint_max_mod
+            increment *= sprint_inc_mod
+        # Gradually return to normal speed when not sprinting (ground only)
+        elif decel_active:
+            decel_factor = 0.99  # 1% reduction per frame
+            current_target = max_vel_x * decel_ratio
+            if abs(vel_x) > current_target:
+                vel_x *= decel_factor
+                decel_ratio *= decel_factor
+            else:
+                decel_active = False
+    # In air - maintain sprint speed if we were sprinting when we jumped
+    elif sprint_jumped:
+        max_vel_x *= sprint_max_mod
+        increment *= sprint_inc_mod
+    
+    # Left movement
+    if left:
+        target_vel = -max_vel_x
+        if not sprinting and decel_active and not jumped:
+            target_vel *= decel_ratio
+        vel_x = max(target_vel, vel_x - increment)
+    
+    # Right movement
+    if right:
+        target_vel = max_vel_x
+        if not sprinting and decel_active and not jumped:
+            target_vel *= decel_ratio
+        vel_x = min(target_vel, vel_x + increment)
+    
+    return vel_x, decel_ratio, decel_active, max_vel_x, increment
 
 class Knight:
     """
     Player character with movement, animation, and collision handling.
     """
     
-    def __init__(self, x, y, screen, world_rects):
+    __slots__ = (
+        'size', 'index', 'counter', 'screen', 'world', 'frames', 'image', 'rect', 
+        'vel_x', 'vel_y', 'sprinting', 'moving', 'jumped', 'flipped', 
+        'was_sprinting_when_jumped', 'sprint_decel_ratio', 'sprint_decel_active')
+    
+    def __init__(self, x, y, screen, world):
         """
         Args:
             x, y: Starting position
             screen: Main display surface
-            world_rects: List of collision rectangles from World
+            world: World providing collision rectangles
         """
         # Animation properties
         self.size = (14, 19)  # Original sprite size
@@ -20,28 +96,70 @@ class Knight:
         
         # Display properties
         self.screen = screen
-        self.world_rects = world_rects
+        self.world = world
         
-        # Load sprite sheets
-        self.idle_sheet = pygame.image.load("img/knight/knight_idle_sheet.png").convert_alpha()
-        self.run_sheet = pygame.image.load("img/knight/knight_run_sheet.png").convert_alpha()
+        # Load sprite sheets and pre-slice them into scaled frames,
+        # keyed by (animation, flipped)
+        self.frames = {}
+        self.load_frames()
         
         # Initialize sprite and rect
         self._init_sprite(x, y)
         
         # Movement properties
-        self.vel_x = 0
+        self.vel_x = 0.0
         self.vel_y = 0
         self.sprinting = False
         self.moving = False
         self.jumped = False
         self.flipped = False  # For sprite direction
         self.was_sprinting_when_jumped = False  # Track sprint state at jump time
+        self.sprint_decel_ratio: float = 0.0      # Speed ratio kept while slowing down from a sprint
+        self.sprint_decel_active: bool = False    # Whether that slowdown is in progress
+    
+    def load_frames(self):
+        """
+        Build the animation frame cache.
+        
+        Frames are converted to the display's pixel format when they are built,
+        so this must be called again (after image_cache.load.cache_clear())
+        if the display mode changes.
+        """
+        self._load_frames('idle', "img/knight/knight_idle_sheet.png", 4)
+        self._load_frames('run', "img/knight/knight_run_sheet.png", 16)
+    
+    def _load_frames(self, name, path, steps):
+        """
+        Slice a sprite sheet into scaled frames, plus their flipped versions.
+        
+        Args:
+            name: Animation key used by animate()
+            path: Sprite sheet image path
+            steps: Number of frames in the sheet
+        """
+        sheet = image_cache.load(path)
+        
+        # Scale and mirror the whole sheet once; frames are then cut from these
+        scaled_sheet = pygame.transform.scale(sheet, (SCALED[0] * steps, SCALED[1]))
+        flipped_sheet = pygame.transform.flip(scaled_sheet, True, False)
+        frames, flipped_frames = [], []
+        
+        for i in range(steps):
+            # Mirroring the sheet also reverses the frame order
+            frame_rect = (i * SCALED[0], 0, *SCALED)
+            flipped_rect = ((steps - 1 - i) * SCALED[0], 0, *SCALED)
+            
+            # Scale/flip results aren't guaranteed to be in display format,
+            # so convert them to keep blits free of per-pixel conversion
+            frames.append(scaled_sheet.subsurface(frame_rect).convert_alpha())
+            flipped_frames.append(flipped_sheet.subsurface(flipped_rect).convert_alpha())
+        
+        self.frames[(name, False)] = frames
+        self.frames[(name, True)] = flipped_frames
     
     def _init_sprite(self, x, y):
         """Initialize the sprite image and rect."""
-        aux = self.idle_sheet.subsurface(0, 0, self.size[0], self.size[1])
-        self.image = pygame.transform.scale(aux, (self.size[0]*3.5, self.size[1]*3.5))
+        self.image = self.frames[('idle', False)][0]
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
@@ -55,15 +173,17 @@ class Knight:
             world_limit: Right boundary of the world
         """
         key = pygame.key.get_pressed()
+        left, right = key[K_a], key[K_d]
+        jump, sprint = key[K_SPACE], key[K_LSHIFT]
         
         # Handle animations based on movement
-        if key[pygame.K_a] or key[pygame.K_d]:
-            self.animate(self.run_sheet, 16, 8)  # Run animation
+        if left or right:
+            self.animate('run', 8)  # Run animation
         else:
-            self.animate(self.idle_sheet, 4, 10)  # Idle animation
+            self.animate('idle', 10)  # Idle animation
         
         # Movement and physics
-        self._handle_movement(key)
+        self._handle_movement(left, right, jump, sprint)
         self._apply_gravity()
         self._handle_collisions()
         
@@ -71,137 +191,99 @@ class Knight:
         self._clamp_position(world_limit)
         
         # Render player
-        self.screen.blit(self.image, (self.rect.x - cam_offset_x, self.rect.y - cam_offset_y))
+        rect = self.rect
+        self.screen.blit(self.image, (rect.x - cam_offset_x, rect.y - cam_offset_y))
     
-    def _handle_movement(self, key):
+    def _handle_movement(self, left, right, jump, sprint):
         """Process keyboard input for movement."""
         # Horizontal movement
-        self._move_x(key, increment=0.5, max_vel_x=7.5, 
+        self._move_x(left, right, sprint, jump, increment=0.5, max_vel_x=7.5, 
                     sprint_inc_mod=1.7, sprint_max_mod=1.7)
         
         # Apply friction when on ground
         if not self.jumped:
-            self._apply_friction(key, amount=1.3)
+            self._apply_friction(left or right, amount=1.3)
         
         # Jumping
-        if key[pygame.K_SPACE] and not self.jumped:
+        if jump and not self.jumped:
             self.vel_y = -20
             self.jumped = True
     
-    def _move_x(self, key, increment, max_vel_x, sprint_inc_mod, sprint_max_mod):
+    def _move_x(self, left, right, sprint, jump_pressed, increment, max_vel_x, sprint_inc_mod, sprint_max_mod):
         """Handle horizontal movement with special air sprint rules."""
         was_sprinting = self.sprinting
-        self.sprinting = key[pygame.K_LSHIFT]
+        self.sprinting = sprint
+        jumped = self.jumped
         
-        # Only apply deceleration if grounded
-        if not self.jumped:
-            # If we just stopped sprinting while grounded, store speed ratio
-            if was_sprinting and not self.sprinting:
-                self.sprint_decel_ratio = abs(self.vel_x) / (max_vel_x * sprint_max_mod)
-            
-            # Adjust movement parameters if sprinting
-            if self.sprinting:
-                max_vel_x *= sprint_max_mod
-                increment *= sprint_inc_mod
-            # Gradually return to normal speed when not sprinting (ground only)
-            elif hasattr(self, 'sprint_decel_ratio'):
-                decel_factor = 0.99  # 1% reduction per frame
-                current_target = max_vel_x * self.sprint_decel_ratio
-                if abs(self.vel_x) > current_target:
-                    self.vel_x *= decel_factor
-                    self.sprint_decel_ratio *= decel_factor
-                else:
-                    del self.sprint_decel_ratio
-        else:
-            # In air - maintain sprint speed if we were sprinting when we jumped
-            if hasattr(self, 'was_sprinting_when_jumped'):
-                if self.was_sprinting_when_jumped:
-                    max_vel_x *= sprint_max_mod
-                    increment *= sprint_inc_mod
-        
-        # Left movement
-        if key[pygame.K_a]:
-            target_vel = -max_vel_x
-            if not self.sprinting and hasattr(self, 'sprint_decel_ratio') and not self.jumped:
-                target_vel *= self.sprint_decel_ratio
-            self.vel_x = max(target_vel, self.vel_x - increment)
-            self.flipped = True
+        vel_x, self.sprint_decel_ratio, self.sprint_decel_active, max_vel_x, increment = step_horizontal(
+            self.vel_x, left, right, sprint, was_sprinting, 
+            jumped, self.was_sprinting_when_jumped, 
+            self.sprint_decel_ratio, self.sprint_decel_active, 
+            increment, max_vel_x, sprint_inc_mod, sprint_max_mod)
+        self.vel_x = vel_x
         
-        # Right movement
-        if key[pygame.K_d]:
-            target_vel = max_vel_x
-            if not self.sprinting and hasattr(self, 'sprint_decel_ratio') and not self.jumped:
-                target_vel *= self.sprint_decel_ratio
-            self.vel_x = min(target_vel, self.vel_x + increment)
+        # Face the direction of movement (right wins if both are pressed)
+        if right:
             self.flipped = False
+        elif left:
+            self.flipped = True
         
         # Track if we were sprinting at jump time
-        if key[pygame.K_SPACE] and not self.jumped:
-            self.was_sprinting_when_jumped = self.sprinting
+        if jump_pressed and not jumped:
+            self.was_sprinting_when_jumped = sprint
         
-        debug(f"Sprint:{self.sprinting}, Max:{max_vel_x}, Inc:{increment}, Vel:{self.vel_x}")
+        if __debug__ and DEBUG_HUD:
+            debug(f"Sprint:{sprint}, Max:{max_vel_x}, Inc:{increment}, Vel:{vel_x}")
     
-    def _apply_friction(self, key, amount):
+    def _apply_friction(self, moving_input, amount):
         """Slow down horizontal movement when no keys are pressed."""
-        if not (key[pygame.K_a] or key[pygame.K_d]):
-            if self.vel_x > 0:
-                self.vel_x = max(0, self.vel_x - amount)
-            elif self.vel_x < 0:
-                self.vel_x = min(0, self.vel_x + amount)
+        if not moving_input:
+            vel_x = self.vel_x
+            if vel_x > 0:
+                self.vel_x = max(0, vel_x - amount)
+            elif vel_x < 0:
+                self.vel_x = min(0, vel_x + amount)
     
     def _apply_gravity(self, terminal_velocity=30, gravity=1):
         """Apply gravity with terminal velocity."""
-        if self.vel_y < terminal_velocity:
-            self.vel_y += gravity
+        self.vel_y = apply_gravity(self.vel_y, terminal_velocity, gravity)
     
     def _handle_collisions(self):
         """Resolve collisions with world tiles."""
-        for tile in self.world_rects:
-            # Horizontal collision
-            if tile.colliderect(self.rect.x + self.vel_x, self.rect.y, self.rect.width, self.rect.height):
-                if self.vel_x > 0:  # Moving right
-                    self.vel_x = tile.left - self.rect.right
-                elif self.vel_x < 0:  # Moving left
-                    self.vel_x = tile.right - self.rect.left
-            
-            # Vertical collision
-            if tile.colliderect(self.rect.x, self.rect.y + self.vel_y, self.rect.width, self.rect.height):
-                if self.vel_y > 0:  # Falling
-                    self.vel_y = tile.top - self.rect.bottom
-                    self.jumped = False
-                elif self.vel_y < 0:  # Jumping
-                    self.vel_y = tile.bottom - self.rect.top
+        rect = self.rect
+        vel_x, vel_y = self.vel_x, self.vel_y
+        
+        # Broad phase: swept box covering both axis-displaced rects, built from
+        # the same truncated positions the narrow phase tests
+        next_x, next_y = int(rect.x + vel_x), int(rect.y + vel_y)
+        swept = rect.union(pygame.Rect(next_x, next_y, rect.width, rect.height))
+        
+        tiles = [tile for tile in self.world.query(swept) if tile.colliderect(swept)]
+        
+        self.vel_x, self.vel_y, landed = resolve_collisions(*rect, vel_x, vel_y, tiles)
+        if landed:
+            self.jumped = False
     
     def _clamp_position(self, world_limit):
         """Keep player within world boundaries."""
-        self.rect.x = max(0, min(self.rect.x + self.vel_x, world_limit - self.rect.width))
-        self.rect.y += self.vel_y
+        rect = self.rect
+        x, y, w, _ = rect
+        rect.x, rect.y = clamp_position(x, y, w, self.vel_x, self.vel_y, world_limit)
     
-    def animate(self, sprite_sheet, steps, anim_cooldown):
+    def animate(self, name, anim_cooldown):
         """
         Update sprite animation.
         
         Args:
-            sprite_sheet: Source image containing animation frames
-            steps: Number of frames in animation
+            name: Animation to play ('idle' or 'run')
             anim_cooldown: Frames between animation updates
         """
         self.counter += 1
         
         if self.counter > anim_cooldown:
             self.counter = 0
-            self.index = (self.index + 1) % steps
-            
-            # Get current frame
-            aux = sprite_sheet.subsurface(
-                self.index * self.size[0], 0, 
-                self.size[0], self.size[1])
-            
-            # Flip if facing left
-            if self.flipped:
-                aux = pygame.transform.flip(aux, True, False)
             
-            # Scale and update image
-            self.image = pygame.transform.scale(
-                aux, 
-                (self.size[0]*3.5, self.size[1]*3.5))
\ No newline at end of file
+            # Pick the pre-scaled frame, flipped if facing left
+            frames = self.frames[(name, self.flipped)]
+            self.index = (self.index + 1) % len(frames)
+            self.image = frames[self.index]
\ No newline at end of file
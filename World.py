@@ -1,4 +1,6 @@
 import pygame
+import image_cache
+from collections import defaultdict
 
 class World:
     """
@@ -14,8 +16,10 @@ class World:
             tile_size (int): Size of each tile in pixels
             screen (pygame.Surface): Main display surface
         """
-        self.img_list = []  # Stores tile images and their positions
+        self.tile_map = []  # Stores tile images by [row][col], None for sky
         self.rects = []     # Stores collision rectangles
+        self.grid = defaultdict(list)  # Maps (col, row) cells to indices into rects
+        self.tile_size = tile_size
         self.screen = screen
         
         # Tile types: 0=sky, 1=dirt, 2=grass, 3=half_sky, 4=cloud
@@ -63,10 +67,10 @@ class World:
         
         # Load tile images
         self.tile_images = {
-            1: pygame.image.load('./img/tiles/dirt_floor.png'),
-            2: pygame.image.load('./img/tiles/grassy_floor.png'),
-            3: pygame.image.load('./img/tiles/half_cloud.png'),
-            4: pygame.image.load('./img/tiles/full_cloud.png')
+            1: image_cache.load('./img/tiles/dirt_floor.png'),
+            2: image_cache.load('./img/tiles/grassy_floor.png'),
+            3: image_cache.load('./img/tiles/half_cloud.png'),
+            4: image_cache.load('./img/tiles/full_cloud.png')
         }
         
         self._initialize_tiles(tile_size)
@@ -74,14 +78,17 @@ class World:
     
     def _initialize_tiles(self, tile_size):
         """Create visual tile representations from world data."""
+        # Scale each tile type once so tiles of the same type share a surface
+        scaled_images = {
+            tile: pygame.transform.scale(img, (tile_size, tile_size)).convert_alpha()
+            for tile, img in self.tile_images.items()
+        }
+        
         for i, row in enumerate(self.data):
+            self.tile_map.append([None] * len(row))
             for j, tile in enumerate(row):
-                if tile in self.tile_images:
-                    img = pygame.transform.scale(
-                        self.tile_images[tile], 
-                        (tile_size, tile_size)
-                    )
-                    self._add_tile_to_map(img, tile_size, i, j)
+                if tile in scaled_images:
+                    self._add_tile_to_map(scaled_images[tile], i, j)
     
     def _initialize_collision_rects(self, tile_size):
         """
@@ -97,6 +104,11 @@ class World:
                 if not checked[i][j]:
                     rect = self._find_contiguous_area(tile_size, i, j, checked)
                     self.rects.append(rect)
+        
+        # Bucket every rect into each grid cell it covers
+        for index, rect in enumerate(self.rects):
+            for cell in self._cells(rect):
+                self.grid[cell].append(index)
     
     def _find_contiguous_area(self, tile_size, start_i, start_j, checked):
         """
@@ -133,15 +145,63 @@ class World:
             width * tile_size, 
             height * tile_size)
     
-    def _add_tile_to_map(self, img, tile_size, i, j):
-        """Add a tile image to the render list."""
-        x_coord = j * tile_size
-        y_coord = i * tile_size
-        self.img_list.append((img, (x_coord, y_coord)))
+    def _cells(self, rect):
+        """Yield the (col, row) grid cells overlapped by a rectangle."""
+        for col in range(rect.left // self.tile_size, (rect.right - 1) // self.tile_size + 1):
+            for row in range(rect.top // self.tile_size, (rect.bottom - 1) // self.tile_size + 1):
+                yield col, row
+    
+    def query(self, rect):
+        """
+        Find the collision rectangles that may overlap an area.
+        
+        Args:
+            rect (pygame.Rect): Area to look up
+        
+        Returns:
+            list: Candidate collision rectangles, in the same order as self.rects
+        """
+        indices = set()
+        for cell in self._cells(rect):
+            indices.update(self.grid.get(cell, ()))
+        return [self.rects[i] for i in sorted(indices)]
+    
+    def _add_tile_to_map(self, img, i, j):
+        """Add a tile image to the tile map."""
+        self.tile_map[i][j] = img
     
-    def display(self, cam_offset_x, cam_offset_y):
-        """Render the world with camera offset."""
+    def visible_tiles(self, cam_offset_x, cam_offset_y):
+        """
+        Build the blit list for the tiles inside the viewport.
+        
+        Returns:
+            list: (image, screen position) pairs
+        """
+        # Range of rows and columns on screen
+        first_row = max(0, int(cam_offset_y) // self.tile_size)
+        last_row = min(len(self.tile_map), 
+                       int(cam_offset_y + self.screen.get_height()) // self.tile_size + 1)
+        first_col = max(0, int(cam_offset_x) // self.tile_size)
+        last_col = min(len(self.tile_map[0]), 
+                       int(cam_offset_x + self.screen.get_width()) // self.tile_size + 1)
+        
+        visible = []
+        for i in range(first_row, last_row):
+            row = self.tile_map[i]
+            y = i * self.tile_size - cam_offset_y
+            for j in range(first_col, last_col):
+                img = row[j]
+                if img is not None:
+                    visible.append((img, (j * self.tile_size - cam_offset_x, y)))
+        return visible
+    
+    def display(self, tile_blits):
+        """
+        Render the world.
+        
+        Args:
+            tile_blits (list): Blit list from visible_tiles() for the current camera offset
+        """
         self.screen.fill((20, 152, 220))  # Sky blue background
         
-        for img, (x, y) in self.img_list:
-            self.screen.blit(img, (x - cam_offset_x, y - cam_offset_y))
\ No newline at end of file
+        self.screen.blits(tile_blits, doreturn=False)
\ No newline at end of file
@@ -1,6 +1,7 @@
 import pygame
 pygame.init()
 font = pygame.font.Font(None, 25)
+DEBUG_HUD = False  # Draw debug overlays; they are compiled out entirely under python -O
 def debug(info, y=10, x=10):
     display_surface = pygame.display.get_surface()
     debug_surface = font.render(str(info), True, 'White')
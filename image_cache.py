@@ -0,0 +1,18 @@
+import pygame
+from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def load(path):
+    """
+    Load an image converted to the display's pixel format, once per path.
+    
+    A display mode must be set before the first call, and the cache must be
+    cleared (load.cache_clear()) if the display mode changes.
+    
+    Args:
+        path (str): Image file path
+    
+    Returns:
+        pygame.Surface: Shared surface for this path; copy it before drawing on it
+    """
+    return pygame.image.load(path).convert_alpha()
@@ -0,0 +1,66 @@
+"""
+Knight physics: gravity, tile collision resolution and world clamping.
+
+Only plain numbers cross this module's boundary (tiles are just read for
+their x/y/w/h), so it can be compiled with mypyc:
+
+    python setup.py build_ext --inplace
+
+The compiled extension takes precedence on import; without it the plain
+module is used.
+"""
+from pygame import Rect
+
+
+def apply_gravity(vel_y: float, terminal_velocity: float, gravity: float) -> float:
+    """Apply gravity with terminal velocity."""
+    if vel_y < terminal_velocity:
+        vel_y += gravity
+    return vel_y
+
+
+def resolve_collisions(x: int, y: int, w: int, h: int, vel_x: float, vel_y: float, 
+                       tiles: list[Rect]) -> tuple[float, float, bool]:
+    """
+    Clip the player's velocity against world tiles.
+    
+    Args:
+        x, y, w, h: Player rect
+        vel_x, vel_y: Player velocity
+        tiles: Candidate collision rectangles
+    
+    Returns:
+        tuple: (vel_x, vel_y, landed), landed being True if a tile stopped a fall
+    """
+    landed = False
+    
+    for tile in tiles:
+        left: int = tile.x
+        top: int = tile.y
+        right: int = left + tile.w
+        bottom: int = top + tile.h
+        
+        # Horizontal collision
+        next_x = int(x + vel_x)
+        if left < next_x + w and right > next_x and top < y + h and bottom > y:
+            if vel_x > 0:  # Moving right
+                vel_x = float(left - (x + w))
+            elif vel_x < 0:  # Moving left
+                vel_x = float(right - x)
+        
+        # Vertical collision
+        next_y = int(y + vel_y)
+        if left < x + w and right > x and top < next_y + h and bottom > next_y:
+            if vel_y > 0:  # Falling
+                vel_y = float(top - (y + h))
+                landed = True
+            elif vel_y < 0:  # Jumping
+                vel_y = float(bottom - y)
+    
+    return vel_x, vel_y, landed
+
+
+def clamp_position(x: int, y: int, w: int, vel_x: float, vel_y: float, 
+                   world_limit: int) -> tuple[float, float]:
+    """Move the player by its velocity, keeping it within world boundaries."""
+    return max(0, min(x + vel_x, world_limit - w)), y + vel_y
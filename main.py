@@ -2,7 +2,7 @@ import pygame
 from World import World
 from Knight import Knight
 from Camera import Camera
-from debug import debug
+from debug import debug, DEBUG_HUD
 from psutil import Process, cpu_percent
 from os import getpid
 
@@ -17,11 +17,19 @@ class Game:
         pygame.display.set_caption("Platformer")
         self.clock = pygame.time.Clock()
         
+        # Input is polled with key.get_pressed(), so don't queue events we never read
+        pygame.event.set_blocked([
+            pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT, 
+            pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, 
+            pygame.MOUSEWHEEL])
+        
         # Performance monitoring
         self.cpu_usage = cpu_percent(interval=None)
         self.max_cpu_usage = self.cpu_usage
         self.cpu_update_interval = 1
         self.cpu_update_accumulator = 0
+        self._process = Process(getpid())
+        self._format_performance()
         
         # Game world setup
         self.tile_size = 50
@@ -34,13 +42,20 @@ class Game:
             450, 
             self.screen.get_height() - 230, 
             self.screen, 
-            self.world.rects)
+            self.world)
         
         # Camera setup
         self.camera = Camera(
             self.player, 
             self.screen.get_width(), 
             self.screen.get_height())
+        self.camera.set_bounds(
+            0, self.world_limit_x, 
+            0, self.world_limit_y)
+        
+        # Visible tiles are only recomputed when the camera moves
+        self.camera_moved = True
+        self.tile_blits = []
     
     def run(self):
         """Main game loop."""
@@ -58,27 +73,30 @@ class Game:
     
     def _handle_events(self):
         """Process all pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return False  # Signal to exit game
+        quit_requested = pygame.event.get(pygame.QUIT)
+        # Drop the rest without turning them into Python objects; don't pump,
+        # so nothing arrives (e.g. a new QUIT) that wasn't checked above
+        pygame.event.clear(pump=False)
+        if quit_requested:
+            return False  # Signal to exit game
         return True  # Continue running
     
     def _update(self):
         """Update game state."""
-        self.world.display(self.camera.offset.x, self.camera.offset.y)
+        if self.camera_moved:
+            self.tile_blits = self.world.visible_tiles(self.camera.ox, self.camera.oy)
+        self.world.display(self.tile_blits)
         self.player.update(
-            self.camera.offset.x, 
-            self.camera.offset.y, 
+            self.camera.ox, 
+            self.camera.oy, 
             self.world_limit_x)
-        self.camera.scroll(
-            0, self.world_limit_x, 
-            0, self.world_limit_y)
+        self.camera_moved = self.camera.scroll()
     
     def _render(self):
         """Render debug information."""
-        debug(f"FPS:{self.clock.get_fps():.2f}", x=810)
-        debug(f"Memory:{Process(getpid()).memory_info().rss / 1024 ** 2:.2f} MB", 
-              y=29, x=693)
+        if __debug__ and DEBUG_HUD:
+            debug(self.fps_text, x=810)
+            debug(self.memory_text, y=29, x=693)
     
     def _monitor_performance(self):
         """Update performance metrics."""
@@ -86,13 +104,26 @@ class Game:
         self.cpu_update_accumulator += dt
         
         if self.cpu_update_accumulator >= self.cpu_update_interval:
-            self.cpu_usage = cpu_percent(interval=None)
             self.cpu_update_accumulator -= self.cpu_update_interval
-            if self.cpu_usage > self.max_cpu_usage:
-                self.max_cpu_usage = self.cpu_usage
+            self._sample_performance()
         
-        debug(f"CPU:{self.cpu_usage}%", y=50, x=682)
-        debug(f"MAX:{self.max_cpu_usage}%", y=51, x=812)
+        if __debug__ and DEBUG_HUD:
+            debug(self.cpu_text, y=50, x=682)
+            debug(self.max_cpu_text, y=51, x=812)
+    
+    def _sample_performance(self):
+        """Read CPU usage and refresh the debug strings."""
+        self.cpu_usage = cpu_percent(interval=None)
+        if self.cpu_usage > self.max_cpu_usage:
+            self.max_cpu_usage = self.cpu_usage
+        self._format_performance()
+    
+    def _format_performance(self):
+        """Format the debug strings from the latest readings."""
+        self.fps_text = f"FPS:{self.clock.get_fps():.2f}"
+        self.memory_text = f"Memory:{self._process.memory_info().rss / 1024 ** 2:.2f} MB"
+        self.cpu_text = f"CPU:{self.cpu_usage}%"
+        self.max_cpu_text = f"MAX:{self.max_cpu_usage}%"
 
 if __name__ == "__main__":
     game = Game()
@@ -0,0 +1,9 @@
+from setuptools import setup
+from mypyc.build import mypycify
+
+# Optional: compile the knight physics module in place with
+#   python setup.py build_ext --inplace
+setup(
+    name="pygame_platform_thing",
+    ext_modules=mypycify(["knight_physics.py"]),
+)
@@ -0,0 +1,26 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+import pytest
+from World import World
+from Knight import Knight
+
+
+@pytest.fixture
+def knight():
+    pygame.init()
+    screen = pygame.display.set_mode((900, 700))
+    world = World(50, screen)
+    yield Knight(450, 470, screen, world)
+    pygame.quit()
+
+
+def test_fractional_leftward_move_stops_at_wall(knight):
+    # The ground ledge in rows 11-12 ends at x=1400; stand just right of it
+    knight.rect.topleft = (1400, 560)
+    knight.vel_x, knight.vel_y = -0.85, 0
+    
+    knight._handle_collisions()
+    
+    assert knight.vel_x == 0